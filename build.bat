@@ -23,10 +23,10 @@ echo 1. Before first run: >> dist\README.txt
 echo    - Rename .env.template to .env >> dist\README.txt
 echo    - Edit .env and add your Google Maps API key >> dist\README.txt
 echo. >> dist\README.txt
-echo 2. Run DistanceChecker.exe >> dist\README.txt
+echo 2. Run DistanceChecker\DistanceChecker.exe >> dist\README.txt
 echo. >> dist\README.txt
 echo Note: You can get a Google Maps API key from: >> dist\README.txt
 echo https://console.cloud.google.com/ >> dist\README.txt
 
-echo Build complete! Check the dist folder for the executable.
+echo Build complete! Check the dist\DistanceChecker folder for the executable.
 pause
\ No newline at end of file
@@ -27,8 +27,11 @@ with open(project_root / 'dist' / '.env.template', 'w') as f:
 PyInstaller.__main__.run([
     str(main_script),
     '--name=DistanceChecker',
-    '--onefile',
+    # One-folder build: --onefile unpacks the whole bundle to a temp dir on
+    # every launch, which multiplies startup time
+    '--onedir',
     '--windowed',
+    '--noupx',  # UPX-compressed binaries must be decompressed at startup
     # f'--icon={icon_path}',  # Uncomment if you have an icon
     '--add-data=dist/.env.template;.',  # Include template instead of actual .env
     '--hidden-import=folium',
@@ -3,18 +3,33 @@ Main window module for the Distance Checker application.
 """
 
 import tkinter as tk
+import csv
 # from tkinter import ttk, scrolledtext, messagebox
 from tkinter import ttk, messagebox
 from gui.widgets import AddressEntry, AddressListBox, TimeEntry, StatusBar
 import logging
-from typing import List, Dict
+import math
+import operator
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Optional
 from datetime import datetime
-import pandas as pd
-from utils.google_map_client import get_maps_client, GoogleMapsError
-from gui.map_preview import MapPreview
+from utils.google_map_client import (
+    get_maps_client, GoogleMapsError, chunks, MAX_DESTINATIONS_PER_REQUEST
+)
+from utils.records import AddressRecord
 
 logger = logging.getLogger(__name__)
 
+# Row field used to sort each results column; numeric columns use the
+# parsed values stored alongside the display strings
+_SORT_KEYS = {
+    'address': 'address',
+    'drive_time': '_drive_time_num',
+    'distance': '_distance_num',
+    'status': 'status'
+}
+
 class MainWindow:
     """Main application window class."""
     
@@ -45,9 +60,29 @@ class MainWindow:
             'Out of range': tk.BooleanVar(value=True)
         }
         
-        # Store all tree items
+        # Store all result rows in arrival order, including filtered-out ones
         self.all_tree_items = []
         
+        # Rows that pass the status filters, in sort order. Only the slice
+        # starting at _view_offset that fits in the tree is attached to it.
+        self._view_rows = []
+        self._view_offset = 0
+        self._rendered_range = (0, 0)
+        self._row_metrics = None
+        
+        # Item ids of rows that exist in the tree, attached or detached
+        self._materialized = set()
+        
+        # Background workers for distance lookups, so network round trips
+        # never block the Tk event loop
+        self.executor = ThreadPoolExecutor(max_workers=10)
+        
+        # State of the distance check currently in flight
+        self._run_id = 0
+        self._pending_chunks = 0
+        self._processed = 0
+        self._total = 0
+        
         self.create_widgets()
         self.create_menu()
         self.setup_styles()
@@ -84,8 +119,9 @@ class MainWindow:
         file_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Export Results...", command=self.export_results)
+        file_menu.add_command(label="Clear Cache", command=self.clear_cache)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self.on_closing)
         
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -118,6 +154,11 @@ class MainWindow:
             placeholder="Enter reference address (e.g., school address)..."
         )
         self.reference_address.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
+        self.reference_address.entry.bind(
+            '<FocusOut>',
+            lambda e: self._prefetch_coordinates([self.reference_address.get()]),
+            add='+'
+        )
         
         # Maximum drive time
         self.max_time = TimeEntry(
@@ -137,7 +178,8 @@ class MainWindow:
         self.address_list = AddressListBox(
             input_frame,
             height=8,
-            width=70
+            width=70,
+            on_add=self._prefetch_coordinates
         )
         self.address_list.grid(row=4, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
 
@@ -145,12 +187,13 @@ class MainWindow:
         button_frame = ttk.Frame(input_frame)
         button_frame.grid(row=5, column=0, sticky=(tk.W, tk.E), pady=(10, 0))
         
-        ttk.Button(
+        self.check_button = ttk.Button(
             button_frame,
             text="Check Distances",
             style="Action.TButton",
             command=self.check_distances
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        self.check_button.pack(side=tk.LEFT, padx=5)
         
         ttk.Button(
             button_frame,
@@ -214,31 +257,39 @@ class MainWindow:
         )
         
         # Configure columns with sort bindings
-        self.results_tree.heading('address', text='Address',
-                                command=lambda: self._sort_results('address'))
-        self.results_tree.heading('drive_time', text='Drive Time (min)',
-                                command=lambda: self._sort_results('drive_time'))
-        self.results_tree.heading('distance', text='Distance (miles)',
-                                command=lambda: self._sort_results('distance'))
-        self.results_tree.heading('status', text='Status',
-                                command=lambda: self._sort_results('status'))
+        self._heading_text = {
+            'address': 'Address',
+            'drive_time': 'Drive Time (min)',
+            'distance': 'Distance (miles)',
+            'status': 'Status'
+        }
+        self._last_sort_col = None
+        for col, text in self._heading_text.items():
+            self.results_tree.heading(col, text=text,
+                                    command=lambda c=col: self._sort_results(c))
         
         self.results_tree.column('address', width=400)
         self.results_tree.column('drive_time', width=100)
         self.results_tree.column('distance', width=100)
         self.results_tree.column('status', width=100)
 
-        # Add scrollbar for results
-        results_scroll = ttk.Scrollbar(
+        # Add scrollbar for results. It scrolls through all filtered rows,
+        # not just the ones currently inserted into the tree.
+        self.results_scroll = ttk.Scrollbar(
             results_frame,
             orient=tk.VERTICAL,
-            command=self.results_tree.yview
+            command=self._on_scroll
         )
-        self.results_tree.configure(yscrollcommand=results_scroll.set)
 
         # Grid the results tree and scrollbar
         self.results_tree.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        results_scroll.grid(row=1, column=1, sticky=(tk.N, tk.S))
+        self.results_scroll.grid(row=1, column=1, sticky=(tk.N, tk.S))
+
+        # Re-render the visible rows when the tree is resized or scrolled
+        self.results_tree.bind('<Configure>', lambda e: self._render_window())
+        self.results_tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.results_tree.bind('<Button-4>', self._on_mousewheel)
+        self.results_tree.bind('<Button-5>', self._on_mousewheel)
 
         # Configure results frame grid weights
         results_frame.grid_columnconfigure(0, weight=1)
@@ -260,75 +311,210 @@ class MainWindow:
             self.sort_column = column
             self.sort_reverse = False
         
-        # Get all items
-        items = [(self.results_tree.set(item, column), item) for item in self.results_tree.get_children('')]
+        # Update headings to show sort direction
+        if self._last_sort_col is not None and self._last_sort_col != column:
+            self.results_tree.heading(self._last_sort_col, text=self._heading_text[self._last_sort_col])
+        direction = ' ↓' if self.sort_reverse else ' ↑'
+        self.results_tree.heading(column, text=self._heading_text[column] + direction)
+        self._last_sort_col = column
+        
+        # The filters have not changed, so only the visible rows need sorting
+        self._sort_view()
+        self._redraw_window()
+
+    def _sort_view(self):
+        """Sort the filtered rows by the current sort column and direction."""
+        key = operator.itemgetter(_SORT_KEYS[self.sort_column])
+        self._view_rows.sort(key=key, reverse=self.sort_reverse)
+
+    def _rebuild_tree(self):
+        """Recompute the filtered, sorted view of the stored results and redraw it."""
+        active = self._active_filters()
+        self._view_rows = [
+            row for row in self.all_tree_items
+            if active.get(row['status'], True)
+        ]
+        self._sort_view()
+        self._redraw_window()
+
+    def _redraw_window(self):
+        """Redraw the visible rows in full after the view has been reordered."""
+        # Forget the rendered window so the render does not reuse its rows
+        self._rendered_range = (-1, -1)
+        self._render_window()
+
+    def _active_filters(self) -> Dict[str, bool]:
+        """
+        Snapshot the status filter checkboxes.
         
-        # Sort items
-        items.sort(reverse=self.sort_reverse)
-        if column in ['drive_time', 'distance']:
-            # Sort numerically for numeric columns, handling '-' for error cases
-            items.sort(
-                key=lambda x: float(x[0]) if x[0] != '-' else float('inf'),
-                reverse=self.sort_reverse
-            )
+        Reading a BooleanVar is a Tcl round trip, so callers take one
+        snapshot per pass instead of reading the variables for every row.
         
-        # Rearrange items in sorted order
-        for index, (_, item) in enumerate(items):
-            self.results_tree.move(item, '', index)
+        Returns:
+            Dict mapping status to whether rows with it are shown. Statuses
+            without a filter (such as 'Error') are always shown.
+        """
+        return {status: var.get() for status, var in self.status_filters.items()}
+
+    def _page_size(self) -> int:
+        """Get the number of rows that fit in the results tree."""
+        children = self.results_tree.get_children()
+        bbox = self.results_tree.bbox(children[0]) if children else ''
+        if bbox:
+            # Remember heading height and row height for when the tree is empty
+            _, top, _, row_height = bbox
+            self._row_metrics = (top, row_height)
+        
+        height = self.results_tree.winfo_height()
+        if height <= 1 or self._row_metrics is None:
+            # Not drawn yet, fall back to the configured height
+            return int(self.results_tree['height'])
+        top, row_height = self._row_metrics
+        return max(1, (height - top) // row_height)
+
+    def _render_window(self):
+        """
+        Make the tree show the filtered rows starting at the scroll offset.
         
-        # Update headings to show sort direction
-        for col in ['address', 'drive_time', 'distance', 'status']:
-            if col == column:
-                direction = ' ↓' if self.sort_reverse else ' ↑'
-            else:
-                direction = ''
-            self.results_tree.heading(col, text=self.results_tree.heading(col)['text'].rstrip(' ↑↓') + direction)
+        Only rows entering or leaving the window since the last render are
+        attached or detached, so the Tk cost is bounded by the window size
+        rather than the number of results.
+        """
+        total = len(self._view_rows)
+        page = self._page_size()
+        start = max(0, min(self._view_offset, total - page))
+        end = min(total, start + page)
+        self._view_offset = start
+        
+        old_start, old_end = self._rendered_range
+        if (start, end) != (old_start, old_end):
+            try:
+                self._update_rendered_rows(start, end, old_start, old_end)
+                self._rendered_range = (start, end)
+            except Exception:
+                # Leave the tree empty so the next render redraws it in full
+                self.results_tree.detach(*self.results_tree.get_children())
+                self._rendered_range = (0, 0)
+                raise
+        
+        if total:
+            self.results_scroll.set(start / total, end / total)
+        else:
+            self.results_scroll.set(0, 1)
+
+    def _update_rendered_rows(self, start: int, end: int, old_start: int, old_end: int):
+        """
+        Change the rows in the tree from one window of the view to another.
+        
+        Args:
+            start: Index in _view_rows of the first row to show
+            end: Index in _view_rows after the last row to show
+            old_start: First index currently shown
+            old_end: Index after the last row currently shown
+        """
+        children = self.results_tree.get_children()
+        if start >= old_end or end <= old_start:
+            # No overlap with what is on screen, redraw the whole window
+            # after detaching the old rows in a single call
+            if children:
+                self.results_tree.detach(*children)
+            for row in self._view_rows[start:end]:
+                self._show_row('end', row)
+            return
+        
+        # Detach rows that scrolled out of the window
+        if start > old_start:
+            self.results_tree.detach(*children[:start - old_start])
+        if end < old_end:
+            self.results_tree.detach(*children[end - old_end:])
+        
+        # Attach rows that scrolled into it
+        for index in range(start, old_start):
+            self._show_row(index - start, self._view_rows[index])
+        for index in range(old_end, end):
+            self._show_row('end', self._view_rows[index])
+
+    def _show_row(self, index, row: Dict):
+        """
+        Attach a result row to the tree, inserting it the first time.
+        
+        Detached items keep their values and tags inside Tk, so showing a
+        row again is a single reattach instead of a new insert.
+        
+        Args:
+            index: Position in the tree, as accepted by Treeview.insert
+            row: Stored result row
+        """
+        iid = row['iid']
+        if iid in self._materialized:
+            self.results_tree.reattach(iid, '', index)
+        else:
+            self.results_tree.insert('', index, iid=iid, values=row['_values'], tags=row['_tags'])
+            self._materialized.add(iid)
+
+    def _clear_results(self):
+        """Remove all stored results and their tree items."""
+        self.all_tree_items = []
+        self._view_offset = 0
+        if self._materialized:
+            self.results_tree.delete(*self._materialized)
+            self._materialized.clear()
+        self._rebuild_tree()
+
+    def _on_scroll(self, action: str, amount, unit: str = None):
+        """
+        Handle scrollbar commands by moving the window of rendered rows.
+        
+        Args:
+            action: 'moveto' or 'scroll'
+            amount: Fraction for 'moveto', number of units or pages for 'scroll'
+            unit: 'units' or 'pages' for 'scroll'
+        """
+        if action == 'moveto':
+            self._view_offset = round(float(amount) * len(self._view_rows))
+        elif unit == 'pages':
+            self._view_offset += int(amount) * self._page_size()
+        else:
+            self._view_offset += int(amount)
+        self._render_window()
+
+    def _on_mousewheel(self, event):
+        """Scroll the results with the mouse wheel."""
+        step = -3 if event.num == 4 or event.delta > 0 else 3
+        self._on_scroll('scroll', step, 'units')
+        return 'break'
 
     def _apply_filters(self):
         """Apply status filters to the results."""
-        # Remove all items from tree
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
-        
-        # Add back items that match the filter
-        for item_id, values in self.all_tree_items:
-            status = values['status']
-            if status == 'Error' or self.status_filters.get(status, tk.BooleanVar(value=True)).get():
-                # Create new item with the same values
-                self.results_tree.insert('', 'end', values=(
-                    values['address'],
-                    values['drive_time'],
-                    values['distance'],
-                    values['status']
-                ), tags=('in_range' if status == 'Within range' else 'out_range',))
-        
-        # Maintain sort order after filtering
-        self._sort_results(self.sort_column)
+        self._rebuild_tree()
 
     def check_distances(self):
         """Process addresses and check distances."""
         
         # Clear previous results
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
-        
-        # Clear stored items
-        self.all_tree_items = []
+        self._clear_results()
         
         # Get inputs
         reference = self.reference_address.get().strip()
-        try:
-            max_minutes = self.max_time.get()
-        except ValueError:
+        # TimeEntry.get() returns None for an empty or unparsable value
+        max_minutes = self.max_time.get()
+        if max_minutes is None:
             messagebox.showerror(
                 "Error",
                 "Please enter a valid number for maximum drive time!"
             )
             return
 
-        addresses = self.address_list.get_addresses()
+        # Normalize once, before any network work, so that " foo " and "foo"
+        # are the same address for deduplication and caching
+        addresses = [a for a in (s.strip() for s in self.address_list.get_addresses()) if a]
+        
+        # Query each distinct address once; repeated entries share its result.
+        # Counter keeps first-seen order, so its keys are the unique addresses.
+        occurrences = Counter(addresses)
+        unique = list(occurrences)
 
-        if not reference or not addresses:
+        if not reference or not unique:
             messagebox.showerror(
                 "Error",
                 "Please enter both reference address and addresses to check!"
@@ -336,118 +522,184 @@ class MainWindow:
             return
 
         self.current_results = []
-        total = len(addresses)
-        self.status_bar.start_progress(total)
-        for i, address in enumerate(addresses, 1):
-            self.status_bar.set_status(f"Processing address {i} of {total}...")
-            self.status_bar.update_progress(i)
-            self.root.update_idletasks()
-            
-            try:
-                result = self.maps_client.get_driving_time(reference, address)
-                
-                if result['status'] == 'OK':
-                    is_in_range = result['duration_minutes'] <= max_minutes
-                    status = "Within range" if is_in_range else "Out of range"
-                    tag = 'in_range' if is_in_range else 'out_range'
-                    
-                    # Store the result data
-                    result_data = {
-                        'address': address,
-                        'drive_time': f"{result['duration_minutes']:.1f}",
-                        'distance': f"{result['distance_miles']:.1f}",
-                        'status': status
-                    }
-                    
-                    # Only insert into tree if it matches current filters
-                    if self.status_filters.get(status, tk.BooleanVar(value=True)).get():
-                        item = self.results_tree.insert('', 'end', values=(
-                            address,
-                            f"{result['duration_minutes']:.1f}",
-                            f"{result['distance_miles']:.1f}",
-                            status
-                        ), tags=(tag,))
-                    else:
-                        item = None
-                    
-                    # Store the item and its values (even if not displayed)
-                    self.all_tree_items.append((item, result_data))
-                    
-                    self.current_results.append({
-                        'address': address,
-                        'duration': result['duration_minutes'],
-                        'distance': result['distance_miles'],
-                        'status': status
-                    })
-                else:
-                    # Error results are always shown
-                    item = self.results_tree.insert('', 'end', values=(
-                        address,
-                        '-',
-                        '-',
-                        'Error'
-                    ))
-                    
-                    result_data = {
-                        'address': address,
-                        'drive_time': '-',
-                        'distance': '-',
-                        'status': 'Error'
-                    }
-                    
-                    self.all_tree_items.append((item, result_data))
-                    self.current_results.append({
-                        'address': address,
-                        'duration': None,
-                        'distance': None,
-                        'status': 'Error'
-                    })
-                    
-            except Exception as e:
-                logger.error(f"Error processing address {address}: {str(e)}")
-                # Error results are always shown
-                item = self.results_tree.insert('', 'end', values=(
-                    address,
-                    '-',
-                    '-',
-                    'Error'
-                ))
-                
-                result_data = {
-                    'address': address,
-                    'drive_time': '-',
-                    'distance': '-',
-                    'status': 'Error'
-                }
-                
-                self.all_tree_items.append((item, result_data))
-                self.current_results.append({
-                    'address': address,
-                    'duration': None,
-                    'distance': None,
-                    'status': 'Error'
-                })
+        self._total = sum(occurrences.values())
+        self._processed = 0
+        self.status_bar.start_progress(self._total)
+        self.status_bar.set_status(f"Processing {self._total} addresses...")
+        self.check_button.state(['disabled'])
+        
+        # Results from an earlier run that arrive late are ignored
+        self._run_id += 1
+        run_id = self._run_id
+        
+        address_chunks = list(chunks(unique, MAX_DESTINATIONS_PER_REQUEST))
+        self._pending_chunks = len(address_chunks)
+        for chunk in address_chunks:
+            future = self.executor.submit(
+                self.maps_client.get_driving_times_batch, reference, chunk
+            )
+            future.add_done_callback(
+                lambda f, c=chunk: self.root.after(
+                    0, self._on_chunk_done, f, c, run_id, max_minutes, occurrences
+                )
+            )
+
+    def _on_chunk_done(self, future: Future, chunk: List[str], run_id: int,
+                       max_minutes: float, occurrences: Counter):
+        """
+        Show the results of one batch of addresses. Runs on the Tk thread.
+        
+        Args:
+            future: Completed future returned by get_driving_times_batch
+            chunk: Distinct addresses that were sent in this batch
+            run_id: Identifier of the distance check the batch belongs to
+            max_minutes: Maximum drive time considered within range
+            occurrences: Number of times each address was entered
+        """
+        if run_id != self._run_id:
+            return
+        
+        try:
+            results = future.result()
+        except Exception as e:
+            logger.error(f"Error processing addresses: {str(e)}")
+            results = [{'status': 'ERROR', 'error_message': str(e)}] * len(chunk)
+        
+        # Refresh the status bar about 50 times per run rather than per address
+        progress_step = max(1, self._total // 50)
+        active = self._active_filters()
+        try:
+            for address, result in zip(chunk, results):
+                # Show one row per entry the user made, even for repeated addresses
+                for _ in range(occurrences[address]):
+                    self._processed += 1
+                    if self._processed % progress_step == 0 or self._processed == self._total:
+                        self.status_bar.set_status(f"Processing address {self._processed} of {self._total}...")
+                        self.status_bar.update_progress(self._processed)
+                    self._add_result(address, result, max_minutes, active)
+            self._render_window()
+        finally:
+            # Even if adding rows failed, the run must finish so the button
+            # is enabled again and the progress bar stops
+            self._pending_chunks -= 1
+            if self._pending_chunks == 0:
+                self.status_bar.stop_progress()
+                self.status_bar.set_status("Processing complete!")
+                self.check_button.state(['!disabled'])
                 
-        self.status_bar.stop_progress()
-        self.status_bar.set_status("Processing complete!")
+                # Apply current sort after all results are added
+                self._sort_view()
+                self._redraw_window()
+
+    def _add_result(self, address: str, result: Dict, max_minutes: float,
+                    active: Dict[str, bool]):
+        """
+        Store a distance result and add it to the filtered view.
+        
+        Args:
+            address: The address that was checked
+            result: Driving time result from the maps client
+            max_minutes: Maximum drive time considered within range
+            active: Status filter snapshot from _active_filters()
+        """
+        # Stable tree item id, so the row can be detached and reattached
+        iid = f"r{len(self.all_tree_items)}"
         
-        # Apply current sort after all results are added
-        self._sort_results(self.sort_column)
+        if result['status'] == 'OK':
+            is_in_range = result['duration_minutes'] <= max_minutes
+            status = "Within range" if is_in_range else "Out of range"
+            
+            # Format once; the display strings are shared by every use below
+            dt_str = format(result['duration_minutes'], '.1f')
+            dist_str = format(result['distance_miles'], '.1f')
+            
+            # Store the result data
+            result_data = {
+                'address': address,
+                'drive_time': dt_str,
+                'distance': dist_str,
+                'status': status,
+                'iid': iid,
+                '_drive_time_num': result['duration_minutes'],
+                '_distance_num': result['distance_miles'],
+                # Tree values and tags, built once and reused on every render
+                '_values': (address, dt_str, dist_str, status),
+                '_tags': ('in_range',) if is_in_range else ('out_range',)
+            }
+            
+            # Only show it if it matches current filters
+            if active.get(status, True):
+                self._view_rows.append(result_data)
+            
+            # Store the values (even if not displayed)
+            self.all_tree_items.append(result_data)
+            
+            self.current_results.append({
+                'address': address,
+                'duration': result['duration_minutes'],
+                'distance': result['distance_miles'],
+                'status': status
+            })
+        else:
+            logger.error(f"Error processing address {address}: {result.get('error_message')}")
+            
+            result_data = {
+                'address': address,
+                'drive_time': '-',
+                'distance': '-',
+                'status': 'Error',
+                'iid': iid,
+                # Errors sort after every real result
+                '_drive_time_num': math.inf,
+                '_distance_num': math.inf,
+                '_values': (address, '-', '-', 'Error'),
+                '_tags': ('out_range',)
+            }
+            
+            # Error results are always shown
+            self._view_rows.append(result_data)
+            self.all_tree_items.append(result_data)
+            self.current_results.append({
+                'address': address,
+                'duration': None,
+                'distance': None,
+                'status': 'Error'
+            })
 
     def clear_all(self):
         """Clear all inputs and results."""
+        # Abandon any distance check still in flight
+        self._run_id += 1
+        self._pending_chunks = 0
+        self.status_bar.stop_progress()
+        self.check_button.state(['!disabled'])
+        
         self.reference_address.set("")  # Use set() instead of delete()
         self.max_time.set(15)
         self.address_list.set_addresses([])
-        # Clear results tree
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
-        
-        # Clear stored results
+        # Clear stored results and the results tree
         self.current_results = []
-        self.all_tree_items = []
+        self._clear_results()
         self.status_bar.set_status("")
 
+    def clear_cache(self):
+        """Forget cached lookups so the next check or map queries Google again."""
+        self.maps_client.clear_cache()
+        if hasattr(self, 'map_preview'):
+            self.map_preview.clear_cache()
+        self.status_bar.set_status("Cache cleared")
+
+    def _prefetch_coordinates(self, addresses: List[str]):
+        """
+        Geocode addresses in the background so the map opens from the cache.
+        
+        Args:
+            addresses (List[str]): Addresses just entered by the user
+        """
+        addresses = [a for a in (s.strip() for s in addresses) if a]
+        if addresses:
+            self.executor.submit(self.maps_client.get_coordinates_many, addresses)
+
     def show_map(self):
         """Show selected result on map."""
         selection = self.results_tree.selection()
@@ -471,34 +723,57 @@ class MainWindow:
             )
             return
         
-        # Get all addresses from results
-        all_addresses = []
-        for item in self.results_tree.get_children():
-            item_data = self.results_tree.item(item)['values']
-            if item_data[3] != 'Error':  # Only include addresses that were successfully processed
-                all_addresses.append({
-                    'address': item_data[0],
-                    'drive_time': float(item_data[1]) if item_data[1] != '-' else None,
-                    'distance': float(item_data[2]) if item_data[2] != '-' else None,
-                    'status': item_data[3]
-                })
+        # Get all addresses from the filtered results; the tree itself only
+        # holds the rows currently scrolled into view. Only include addresses
+        # that were successfully processed.
+        all_addresses = [
+            AddressRecord(
+                address=row['address'],
+                # Rounded like the table, since the map shows them as-is
+                drive_time=round(row['_drive_time_num'], 1),
+                distance=round(row['_distance_num'], 1)
+            )
+            for row in self._view_rows if row['status'] != 'Error'
+        ]
         
         try:
             if not hasattr(self, 'map_preview'):
+                # Imported on first use: folium and tkinterweb are slow to load
+                from gui.map_preview import MapPreview
                 self.map_preview = MapPreview(self.root)
-                
+            
+            # A running distance check owns the progress bar
+            if not self._pending_chunks:
+                self.status_bar.start_busy()
+                self.status_bar.set_status("Building map...")
             self.map_preview.show_map(
                 reference_address=reference,
                 selected_address=selected_address,
                 all_addresses=all_addresses,
-                max_time=self.max_time.get()
+                max_time=self.max_time.get(),
+                on_done=self._on_map_shown
             )
         except Exception as e:
-            logger.error(f"Error showing map: {str(e)}")
-            messagebox.showerror(
-                "Error",
-                f"Failed to show map: {str(e)}"
-            )
+            self._on_map_shown(e)
+
+    def _on_map_shown(self, error: Optional[Exception]):
+        """
+        Handle completion of a map build started by show_map.
+        
+        Args:
+            error (Exception, optional): Failure, or None if the map is shown
+        """
+        if not self._pending_chunks:
+            self.status_bar.stop_progress()
+            self.status_bar.set_status("Map ready" if error is None else "")
+        if error is None:
+            return
+        
+        logger.error(f"Error showing map: {str(error)}")
+        messagebox.showerror(
+            "Error",
+            f"Failed to show map: {str(error)}"
+        )
 
     def on_result_double_click(self, event):
         """Handle double-click on result item."""
@@ -513,15 +788,22 @@ class MainWindow:
             )
             return
         
+        from tkinter import filedialog
+        
         try:
-            filename = tk.filedialog.asksaveasfilename(
+            filename = filedialog.asksaveasfilename(
                 defaultextension=".csv",
                 filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
             )
             
             if filename:
-                df = pd.DataFrame(self.current_results)
-                df.to_csv(filename, index=False)
+                with open(filename, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.DictWriter(
+                        f,
+                        fieldnames=['address', 'duration', 'distance', 'status']
+                    )
+                    writer.writeheader()
+                    writer.writerows(self.current_results)
                 messagebox.showinfo(
                     "Success",
                     f"Results exported successfully to {filename}"
@@ -534,6 +816,20 @@ class MainWindow:
                 f"Failed to export results: {str(e)}"
             )
 
+    def cleanup(self):
+        """Release background resources before the application exits."""
+        self.executor.shutdown(wait=False)
+        # Queued lookups, such as geocodes prefetched for a long pasted list,
+        # would otherwise keep the process alive until all of them finish
+        self.maps_client.shutdown()
+        if hasattr(self, 'map_preview'):
+            self.map_preview.cleanup()
+
+    def on_closing(self):
+        """Release background resources and close the application window."""
+        self.cleanup()
+        self.root.destroy()
+
     def show_about(self):
         """Show about dialog."""
         messagebox.showinfo(
@@ -1,16 +1,22 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from tkinterweb import HtmlFrame
-import folium
 import tempfile
 import os
 import logging
+import threading
 import webbrowser
-from typing import Dict, List, Optional
+from typing import Callable, List, Optional
 import json
-from utils.google_map_client import get_maps_client, GoogleMapsError
+from utils.cache import LRUCache
+from utils.google_map_client import get_maps_client, normalize_address, GoogleMapsError
+from utils.polyline import prepare_route_points
+from utils.records import AddressRecord
 
 logger = logging.getLogger(__name__)
+
+# Number of rendered maps kept so revisiting a selection skips the rebuild
+MAP_HTML_CACHE_SIZE = 16
+
 class MapPreview:
     def __init__(self, parent):
         """Initialize map preview window."""
@@ -18,11 +24,43 @@ class MapPreview:
         self.maps_client = get_maps_client()
         self.window = None
         self.html_frame = None
+        
+        # HTML of the map on screen; only written to current_map_file when
+        # the map is opened in a browser
+        self.current_html = None
         self.current_map_file = None
+        
+        # Whether current_map_file exists; this class is the only thing that
+        # creates or deletes it, so there is no need to stat it
+        self._map_file_valid = False
+        
+        # Inputs of the map currently loaded in html_frame
+        self._map_key = None
+        
+        # Rendered map HTML keyed by the inputs it was built from
+        self._html_cache = LRUCache(maxsize=MAP_HTML_CACHE_SIZE)
+        
+        # Incremented for every map build; results of older builds are dropped
+        self._build_id = 0
 
     def show_map(self, reference_address: str, selected_address: str, 
-                all_addresses: List[Dict], max_time: float):
-        """Show map with reference point, selected address, and other locations."""
+                all_addresses: List[AddressRecord], max_time: float,
+                on_done: Optional[Callable[[Optional[Exception]], None]] = None):
+        """
+        Show map with reference point, selected address, and other locations.
+        
+        The map is built on a background thread so the GUI stays responsive
+        while addresses are geocoded; only loading it into the window happens
+        on the Tk thread.
+        
+        Args:
+            reference_address (str): Reference location
+            selected_address (str): Address whose route is drawn
+            all_addresses (List[AddressRecord]): Addresses to mark on the map
+            max_time (float): Maximum drive time in minutes, used for marker colors
+            on_done (Callable, optional): Called on the Tk thread once the map
+                is displayed, with None on success or the exception on failure
+        """
         # Create new window if it doesn't exist or was closed
         if not self.window or not tk.Toplevel.winfo_exists(self.window):
             self.create_window()
@@ -30,11 +68,99 @@ class MapPreview:
         self.window.lift()  # Bring window to front
         self.window.focus_force()  # Force focus
         
+        # Every request supersedes maps still being built, including when
+        # it asks for the map already on screen
+        self._build_id += 1
+        
+        # The map only depends on these inputs, so if they match the map
+        # already on screen there is nothing to rebuild or reload
+        map_key = (
+            reference_address,
+            selected_address,
+            tuple(all_addresses),
+            max_time
+        )
+        if map_key == self._map_key and self.current_html is not None:
+            logger.debug("Map inputs unchanged, keeping the current map")
+            if on_done:
+                on_done(None)
+            return
+        
+        html = self._html_cache.get(map_key)
+        if html is not None:
+            logger.debug("Showing previously rendered map")
+            self._display_map(html, map_key, on_done)
+            return
+        
+        threading.Thread(
+            target=self._build_in_background,
+            args=(self._build_id, map_key, reference_address, selected_address,
+                  all_addresses, max_time, on_done),
+            daemon=True
+        ).start()
+
+    def _build_in_background(self, build_id: int, map_key: tuple,
+                             reference_address: str, selected_address: str,
+                             all_addresses: List[AddressRecord], max_time: float,
+                             on_done: Optional[Callable]):
+        """Build the map HTML on a worker thread and hand it to the Tk thread."""
+        html, error = None, None
         try:
-            self.create_map(reference_address, selected_address, all_addresses, max_time)
+            html = self.create_map(
+                reference_address, selected_address, all_addresses, max_time
+            )
         except Exception as e:
-            logger.error(f"Error creating map: {str(e)}")
-            raise
+            error = e
+        self.parent.after(0, self._on_map_built, build_id, map_key, html, error, on_done)
+
+    def _on_map_built(self, build_id: int, map_key: tuple, html: Optional[str],
+                      error: Optional[Exception], on_done: Optional[Callable]):
+        """Display a finished map, unless a newer build has been started."""
+        if build_id != self._build_id:
+            return
+        
+        # The window was closed while building; the caller still needs to
+        # hear that the build is over
+        if not self.window or not self.window.winfo_exists():
+            if on_done:
+                on_done(None)
+            return
+        
+        if error is None:
+            self._html_cache.set(map_key, html)
+            self._display_map(html, map_key, on_done)
+        elif on_done:
+            on_done(error)
+
+    def _display_map(self, html: str, map_key: tuple, on_done: Optional[Callable]):
+        """Load rendered map HTML into the window and report the outcome."""
+        error = None
+        try:
+            self.html_frame.load_html(html)
+            self.current_html = html
+            self._map_key = map_key
+            # Any file written for the browser now shows an older map
+            self._remove_map_file()
+        except Exception as e:
+            logger.error(f"Error displaying map: {str(e)}")
+            error = e
+        
+        if on_done:
+            on_done(error)
+
+    def clear_cache(self):
+        """Discard previously rendered maps."""
+        self._html_cache.clear()
+
+    def _remove_map_file(self):
+        """Delete the map file written for the browser, if there is one."""
+        if self._map_file_valid:
+            try:
+                os.unlink(self.current_map_file)
+            except Exception as e:
+                logger.error(f"Error cleaning up map file: {str(e)}")
+        self._map_file_valid = False
+        self.current_map_file = None
 
     def create_window(self):
         """Create the map preview window."""
@@ -56,17 +182,49 @@ class MapPreview:
             command=self.open_in_browser
         ).pack(side=tk.LEFT, padx=5)
 
+        # Imported here so only opening the map pays for loading tkinterweb
+        from tkinterweb import HtmlFrame
+
         # Create HTML frame for map
         self.html_frame = HtmlFrame(self.window, messages_enabled=False)
         self.html_frame.grid(row=1, column=0, sticky='nsew', padx=5, pady=5)
+        self._map_key = None
 
     def create_map(self, reference_address: str, selected_address: str, 
-                all_addresses: List[Dict], max_time: float):
-        """Create the map with all locations and routes."""
+                all_addresses: List[AddressRecord], max_time: float) -> str:
+        """
+        Create the map with all locations and routes and render it to HTML.
+        
+        Does not touch any Tk widget, so it is safe to call off the Tk thread.
+        
+        Returns:
+            str: Complete HTML document of the map
+        """
+        # Imported here so only building a map pays for loading folium
+        import folium
+        
         try:
+            # One row per distinct normalized address, for constant-time
+            # lookups and a single marker per location
+            addr_index = {}
+            for a in all_addresses:
+                addr_index.setdefault(normalize_address(a.address), a)
+            selected_key = normalize_address(selected_address)
+            
+            # Fetch the route and geocode every address concurrently instead
+            # of one blocking request after another
+            route_future = self.maps_client.submit(
+                self.maps_client.get_route, reference_address, selected_address
+            )
+            coordinates = self.maps_client.get_coordinates_many(
+                [reference_address, selected_address]
+                + [a.address for a in addr_index.values()]
+            )
+            route = route_future.result()
+            
             # Get coordinates for reference location
-            ref_result = self.maps_client.get_coordinates(reference_address)
-            logger.debug(f"Reference coordinates result: {ref_result}")
+            ref_result = coordinates[reference_address]
+            logger.debug("Reference coordinates result: %s", ref_result)
             
             if ref_result['status'] != 'OK':
                 raise ValueError(f"Could not find coordinates for reference address: {reference_address}")
@@ -92,25 +250,22 @@ class MapPreview:
             bounds = [[ref_result['lat'], ref_result['lng']]]
 
             # Add selected address marker and route
-            sel_result = self.maps_client.get_coordinates(selected_address)
-            logger.debug(f"Selected address coordinates result: {sel_result}")
+            sel_result = coordinates[selected_address]
+            logger.debug("Selected address coordinates result: %s", sel_result)
             
             if sel_result['status'] == 'OK' and sel_result['lat'] != 0 and sel_result['lng'] != 0:
                 # Add marker for selected address
                 selected_coords = [sel_result['lat'], sel_result['lng']]
                 bounds.append(selected_coords)
                 
-                selected_addr_info = next(
-                    (a for a in all_addresses if a['address'] == selected_address), 
-                    None
-                )
+                selected_addr_info = addr_index.get(selected_key)
                 
                 popup_text = f"Selected: {selected_address}"
                 if selected_addr_info:
-                    if selected_addr_info.get('drive_time'):
-                        popup_text += f"<br>Drive time: {selected_addr_info['drive_time']} min"
-                    if selected_addr_info.get('distance'):
-                        popup_text += f"<br>Distance: {selected_addr_info['distance']} miles"
+                    if selected_addr_info.drive_time:
+                        popup_text += f"<br>Drive time: {selected_addr_info.drive_time} min"
+                    if selected_addr_info.distance:
+                        popup_text += f"<br>Distance: {selected_addr_info.distance} miles"
                 
                 folium.Marker(
                     selected_coords,
@@ -118,20 +273,16 @@ class MapPreview:
                     icon=folium.Icon(color='green', icon='info-sign')
                 ).add_to(m)
 
-                # Get and add route
-                route = self.maps_client.get_route(reference_address, selected_address)
-
+                # Add route
                 if route['status'] == 'OK' and route['points']:
                     try:
-                        # Validate route points
-                        validated_points = []
-                        for point in route['points']:
-                            if isinstance(point, (list, tuple)) and len(point) == 2:
-                                try:
-                                    lat, lng = float(point[0]), float(point[1])
-                                    validated_points.append([lat, lng])
-                                except (ValueError, TypeError):
-                                    continue
+                        # Drop invalid points and simplify the line so the
+                        # rendered HTML only carries the vertices that matter
+                        validated_points = prepare_route_points(route['points'])
+                        logger.debug(
+                            "Route simplified from %d to %d points",
+                            len(route['points']), len(validated_points)
+                        )
 
                         if validated_points:
                             folium.PolyLine(
@@ -146,23 +297,16 @@ class MapPreview:
                             logger.warning("No valid route points found")
                             
                     except Exception as e:
-                        logger.error(f"Error drawing route: {str(e)}")                
-                if route['status'] == 'OK' and route.get('points'):
-                    folium.PolyLine(
-                        route['points'],
-                        weight=3,
-                        color='blue',
-                        opacity=0.8,
-                        popup=f"Drive time: {route['duration_minutes']} min<br>"
-                            f"Distance: {route['distance_miles']} miles"
-                    ).add_to(m)
+                        logger.error(f"Error drawing route: {str(e)}")
 
             # Add other addresses
-            for addr_data in all_addresses:
-                addr = addr_data['address']
-                if addr != selected_address:
-                    coords = self.maps_client.get_coordinates(addr)
-                    logger.debug(f"Other address coordinates result for {addr}: {coords}")
+            debug = logger.isEnabledFor(logging.DEBUG)
+            for key, addr_data in addr_index.items():
+                if key != selected_key:
+                    addr = addr_data.address
+                    coords = coordinates[addr]
+                    if debug:
+                        logger.debug("Other address coordinates result for %s: %s", addr, coords)
                     
                     if (coords['status'] == 'OK' and 
                         coords['lat'] != 0 and coords['lng'] != 0):
@@ -171,17 +315,17 @@ class MapPreview:
                         bounds.append(addr_coords)
                         
                         # Determine marker color based on drive time
-                        try:
-                            drive_time = float(addr_data.get('drive_time', 0))
-                            color = 'green' if drive_time <= max_time else 'red'
-                        except (TypeError, ValueError):
+                        drive_time = addr_data.drive_time
+                        if drive_time is None or max_time is None:
                             color = 'gray'
+                        else:
+                            color = 'green' if drive_time <= max_time else 'red'
                         
                         popup_text = f"Address: {addr}"
-                        if addr_data.get('drive_time'):
-                            popup_text += f"<br>Drive time: {addr_data['drive_time']} min"
-                        if addr_data.get('distance'):
-                            popup_text += f"<br>Distance: {addr_data['distance']} miles"
+                        if addr_data.drive_time:
+                            popup_text += f"<br>Drive time: {addr_data.drive_time} min"
+                        if addr_data.distance:
+                            popup_text += f"<br>Distance: {addr_data.distance} miles"
                         
                         folium.Marker(
                             addr_coords,
@@ -193,20 +337,12 @@ class MapPreview:
             if len(bounds) > 1:
                 m.fit_bounds(bounds)
 
-            # Save and display map
+            # Render map
             try:
-                # Clean up previous map file
-                if self.current_map_file and os.path.exists(self.current_map_file):
-                    os.unlink(self.current_map_file)
-
-                # Create new temporary file
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.html') as tmp:
-                    m.save(tmp.name)
-                    self.current_map_file = tmp.name
-                    self.html_frame.load_file(tmp.name)
+                return m.get_root().render()
 
             except Exception as e:
-                logger.error(f"Error saving or displaying map: {str(e)}")
+                logger.error(f"Error rendering map: {str(e)}")
                 raise
 
         except Exception as e:
@@ -215,18 +351,30 @@ class MapPreview:
 
     def open_in_browser(self):
         """Open the current map in default web browser."""
-        if self.current_map_file and os.path.exists(self.current_map_file):
-            webbrowser.open(f'file://{self.current_map_file}')
-        else:
+        if self.current_html is None:
             messagebox.showwarning(
                 "No Map",
                 "No map is currently displayed to open in browser."
             )
+            return
+        
+        # The browser needs a file, so write one the first time it is asked for
+        if not self._map_file_valid:
+            try:
+                with tempfile.NamedTemporaryFile(
+                    'w', encoding='utf-8', delete=False, suffix='.html'
+                ) as tmp:
+                    tmp.write(self.current_html)
+                self.current_map_file = tmp.name
+                self._map_file_valid = True
+            except Exception as e:
+                logger.error(f"Error saving map: {str(e)}")
+                messagebox.showerror("Error", f"Failed to save map: {str(e)}")
+                return
+        
+        webbrowser.open(f'file://{self.current_map_file}')
 
     def cleanup(self):
         """Clean up temporary files."""
-        if self.current_map_file and os.path.exists(self.current_map_file):
-            try:
-                os.unlink(self.current_map_file)
-            except Exception as e:
-                logger.error(f"Error cleaning up map file: {str(e)}")
\ No newline at end of file
+        self._build_id += 1  # Discard any map still being built
+        self._remove_map_file()
\ No newline at end of file
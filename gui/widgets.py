@@ -11,6 +11,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Non-negative decimal number, as accepted by TimeEntry
+_NUM_RE = re.compile(r'\d+\.?\d*|\.\d+')
+
 class AddressEntry(ttk.Frame):
     def __init__(self, master, placeholder: str = "Enter address...", width: int = 60, **kwargs):
         super().__init__(master, **kwargs)
@@ -87,6 +90,7 @@ class AddressListBox(ttk.Frame):
         master,
         height: int = 10,
         width: int = 60,
+        on_add: Optional[Callable[[List[str]], None]] = None,
         **kwargs
     ):
         """
@@ -96,10 +100,14 @@ class AddressListBox(ttk.Frame):
             master: Parent widget
             height (int): Number of visible lines
             width (int): Widget width
+            on_add (Callable, optional): Called with the addresses newly
+                added through the Add or Bulk Add buttons
             **kwargs: Additional arguments for Frame
         """
         super().__init__(master, **kwargs)
         
+        self.on_add = on_add
+        
         # Create main listbox
         self.listbox = tk.Listbox(
             self,
@@ -157,17 +165,28 @@ class AddressListBox(ttk.Frame):
             # Check for duplicates before adding
             if dialog.result not in self.get_addresses():
                 self.listbox.insert(tk.END, dialog.result)
+                self._notify_added([dialog.result])
 
     def _bulk_add_addresses(self):
         """Show dialog to add multiple addresses at once."""
         dialog = BulkAddressDialog(self)
         if dialog.result:
-            # Get current addresses for duplicate checking
-            current_addresses = self.get_addresses()
-            # Add only non-duplicate addresses
+            # Add only addresses not already listed or repeated in the paste
+            existing = set(self.get_addresses())
+            added = []
             for addr in dialog.result:
-                if addr not in current_addresses:
-                    self.listbox.insert(tk.END, addr)
+                if addr not in existing:
+                    existing.add(addr)
+                    added.append(addr)
+            if added:
+                # One Tcl call for the whole batch
+                self.listbox.insert(tk.END, *added)
+            self._notify_added(added)
+
+    def _notify_added(self, addresses: List[str]):
+        """Pass newly added addresses to the on_add callback, if any."""
+        if addresses and self.on_add:
+            self.on_add(addresses)
 
     def _remove_selected(self):
         """Remove selected addresses."""
@@ -186,8 +205,8 @@ class AddressListBox(ttk.Frame):
     def set_addresses(self, addresses: List[str]):
         """Set the list of addresses."""
         self.listbox.delete(0, tk.END)
-        for addr in addresses:
-            self.listbox.insert(tk.END, addr)
+        if addresses:
+            self.listbox.insert(tk.END, *addresses)
 
 class AddressInputDialog(tk.Toplevel):
     """Dialog for entering a new address."""
@@ -289,16 +308,25 @@ class StatusBar(ttk.Frame):
 
     def start_progress(self, maximum: int = 100):
         """Start progress indication."""
+        self.progress.stop()
+        self.progress['mode'] = 'determinate'
         self.progress['maximum'] = maximum
         self.progress['value'] = 0
         self.progress.pack(side=tk.RIGHT, padx=5)
 
+    def start_busy(self):
+        """Start an animated indicator for work of unknown length."""
+        self.progress['mode'] = 'indeterminate'
+        self.progress.pack(side=tk.RIGHT, padx=5)
+        self.progress.start()
+
     def update_progress(self, value: int):
         """Update progress value."""
         self.progress['value'] = value
 
     def stop_progress(self):
         """Stop progress indication."""
+        self.progress.stop()
         self.progress.pack_forget()
 
 class TimeEntry(ttk.Frame):
@@ -333,11 +361,9 @@ class TimeEntry(ttk.Frame):
         """Validate entry value."""
         if not new_value:
             return True
-        try:
-            value = float(new_value)
-            return value >= 0
-        except ValueError:
-            return False
+        # Matching the pattern is enough: it only accepts non-negative
+        # numbers, and avoids raising on every rejected keystroke
+        return _NUM_RE.fullmatch(new_value) is not None
 
     def get(self) -> Optional[float]:
         """Get the current value."""
@@ -442,11 +468,11 @@ class BulkAddressDialog(tk.Toplevel):
     def _on_ok(self):
         """Handle OK button click."""
         text = self.text_area.get("1.0", tk.END)
-        # Split text into lines and filter out empty lines
+        # Split text into lines and filter out empty lines, stripping each once
         addresses = [
-            addr.strip() 
-            for addr in text.split('\n') 
-            if addr.strip()
+            addr
+            for addr in (line.strip() for line in text.splitlines())
+            if addr
         ]
         
         if addresses:
@@ -5,6 +5,8 @@ Main entry point for the Distance Checker application.
 import tkinter as tk
 import sys
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 from datetime import datetime
 import argparse
@@ -12,12 +14,19 @@ import argparse
 from gui.main_window import MainWindow
 from utils.config import get_config, ConfigurationError
 
-def setup_logging(log_level: str = 'INFO') -> None:
+def setup_logging(log_level: str = 'INFO') -> logging.handlers.QueueListener:
     """
     Setup logging configuration.
     
+    Log calls only put records on a queue; a background listener thread
+    writes them to the log file and stdout, so worker threads never block
+    on I/O while logging.
+    
     Args:
         log_level: Logging level (default: INFO)
+        
+    Returns:
+        logging.handlers.QueueListener: Started listener, to be stopped on exit
     """
     # Create logs directory if it doesn't exist
     log_dir = Path(__file__).parent.parent / 'logs'
@@ -27,15 +36,25 @@ def setup_logging(log_level: str = 'INFO') -> None:
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     log_file = log_dir / f'distance_checker_{timestamp}.log'
     
-    # Configure logging
-    logging.basicConfig(
-        level=log_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    # Handlers that do the actual writing, run by the listener thread
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [
+        logging.FileHandler(log_file),
+        logging.StreamHandler(sys.stdout)
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    # Configure logging; the queue handler is left without a formatter so
+    # records are only formatted once, by the handlers above
+    log_queue = queue.Queue(-1)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(log_level)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    return listener
 
 def parse_arguments():
     """Parse command line arguments."""
@@ -58,10 +77,11 @@ def main():
     """Main application entry point."""
     # Parse command line arguments
     args = parse_arguments()
+    log_listener = None
     
     try:
         # Setup logging
-        setup_logging(args.log_level)
+        log_listener = setup_logging(args.log_level)
         logger = logging.getLogger(__name__)
         logger.info("Starting Distance Checker application")
         
@@ -109,13 +129,7 @@ def main():
         root.minsize(800, 600)
         
         # Handle window close
-        def on_closing():
-            """Handle window closing event."""
-            if hasattr(app, 'cleanup'):
-                app.cleanup()
-            root.destroy()
-            
-        root.protocol("WM_DELETE_WINDOW", on_closing)
+        root.protocol("WM_DELETE_WINDOW", app.on_closing)
         
         # Start the application
         logger.info("Application GUI initialized, starting main loop")
@@ -126,6 +140,9 @@ def main():
         sys.exit(1)
     finally:
         logger.info("Application shutting down")
+        if log_listener is not None:
+            # Flushes queued records and stops the listener thread
+            log_listener.stop()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,62 @@
+"""
+Tests for the vectorized polyline decoder.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from utils.polyline import decode_polyline
+
+def encode_polyline(points):
+    """
+    Encode (lat, lng) pairs in Google's encoded polyline format.
+
+    A plain per-value implementation of the format, used as the reference
+    the vectorized decoder is checked against.
+    """
+    encoded = []
+    prev_lat = prev_lng = 0
+    for lat, lng in points:
+        lat_e5, lng_e5 = round(lat * 1e5), round(lng * 1e5)
+        for delta in (lat_e5 - prev_lat, lng_e5 - prev_lng):
+            value = ~(delta << 1) if delta < 0 else delta << 1
+            while value >= 0x20:
+                encoded.append(chr((0x20 | (value & 0x1f)) + 63))
+                value >>= 5
+            encoded.append(chr(value + 63))
+        prev_lat, prev_lng = lat_e5, lng_e5
+    return "".join(encoded)
+
+def test_known_polyline():
+    # Example from Google's polyline algorithm documentation
+    points = decode_polyline("_p~iF~ps|U_ulLnnqC_mqNvxq`@")
+    np.testing.assert_allclose(
+        points, [[38.5, -120.2], [40.7, -120.95], [43.252, -126.453]]
+    )
+
+def test_empty_polyline():
+    assert decode_polyline("").shape == (0, 2)
+
+def test_round_trip_random_polylines():
+    rng = random.Random(0)
+    for _ in range(2000):
+        points = [
+            (round(rng.uniform(-90, 90), 5), round(rng.uniform(-180, 180), 5))
+            for _ in range(rng.randint(1, 50))
+        ]
+        decoded = decode_polyline(encode_polyline(points))
+        np.testing.assert_allclose(decoded, points, atol=1e-9)
+
+@pytest.mark.parametrize("encoded", [
+    "_p~iF~ps|",  # last value is missing its final chunk
+    "_p~iF",      # latitude without its longitude
+])
+def test_truncated_polyline(encoded):
+    with pytest.raises(ValueError):
+        decode_polyline(encoded)
+
+def test_invalid_character():
+    with pytest.raises(ValueError):
+        decode_polyline("_p~iF~ps|U ")
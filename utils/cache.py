@@ -0,0 +1,156 @@
+"""
+Cache utilities shared by the application's API clients.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+class LRUCache:
+    """Thread-safe mapping that evicts the least recently used entry when full."""
+
+    def __init__(self, maxsize: int = 4096):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize (int): Maximum number of entries to keep
+        """
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value and mark it as recently used.
+
+        Args:
+            key: Cache key
+            default: Value to return if key is not cached
+
+        Returns:
+            Cached value or default if not found
+        """
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+class DiskCache:
+    """Persistent cache of JSON-serializable values stored in SQLite."""
+
+    def __init__(self, path: Path, table: str = 'cache', max_age: Optional[int] = None):
+        """
+        Open (and create if needed) the cache database.
+
+        Errors reading or writing entries later on are logged and treated as
+        cache misses, so a broken cache never breaks the caller.
+
+        Args:
+            path (Path): Location of the SQLite database file
+            table (str): Name of the table holding the entries
+            max_age (int, optional): Seconds after which an entry is treated
+                as missing; entries never expire if not given
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened or created
+        """
+        self.path = Path(path)
+        self.table = table
+        self.max_age = max_age
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit each statement; WAL with NORMAL sync keeps writes cheap
+        # without risking corruption, at worst losing the latest entries
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, ts INTEGER NOT NULL)"
+            )
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key (str): Cache key
+            default: Value to return if key is not cached
+
+        Returns:
+            Cached value or default if not found
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    f"SELECT value, ts FROM {self.table} WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Error reading from cache {self.path}: {str(e)}")
+            return default
+        if row is None:
+            return default
+        if self.max_age is not None and time.time() - row[1] > self.max_age:
+            return default
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value, replacing any existing entry for the key.
+
+        Args:
+            key (str): Cache key
+            value: JSON-serializable value to store
+        """
+        try:
+            with self._lock:
+                self._conn.execute(
+                    f"INSERT OR REPLACE INTO {self.table} (key, value, ts) VALUES (?, ?, ?)",
+                    (key, json.dumps(value), int(time.time()))
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Error writing to cache {self.path}: {str(e)}")
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        try:
+            with self._lock:
+                self._conn.execute(f"DELETE FROM {self.table}")
+        except sqlite3.Error as e:
+            logger.warning(f"Error clearing cache {self.path}: {str(e)}")
@@ -4,12 +4,22 @@ Configuration utility module for loading and managing application settings.
 
 import os
 from pathlib import Path
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 from dotenv import load_dotenv
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Default locations of the .env file and its template, in the project root
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_DEFAULT_ENV = _PROJECT_ROOT / '.env'
+_DEFAULT_ENV_TEMPLATE = _PROJECT_ROOT / '.env.template'
+
+# Parsed configuration keyed by (absolute .env path, modification time), so
+# constructing Config again only re-reads the file after it has changed
+_ENV_CACHE: Dict[Tuple[str, int], Dict] = {}
+
 class ConfigurationError(Exception):
     """Custom exception for configuration-related errors."""
     pass
@@ -17,6 +27,8 @@ class ConfigurationError(Exception):
 class Config:
     """Configuration manager for the application."""
     
+    __slots__ = ('_config', '_config_view')
+    
     def __init__(self, env_path: str = None):
         """
         Initialize configuration manager.
@@ -28,11 +40,18 @@ class Config:
         self._config = {}
         self._load_env(env_path)
         self._validate_config()
+        
+        # Read-only view returned by get_all(), so callers need no copy
+        self._config_view = MappingProxyType(self._config)
 
     def _load_env(self, env_path: str = None) -> None:
         """
         Load environment variables from .env file.
         
+        If no path is given and GOOGLE_MAPS_API_KEY is already set in the
+        process environment, settings are read from the environment alone
+        and no .env file is required.
+        
         Args:
             env_path (str, optional): Path to .env file.
         
@@ -40,14 +59,33 @@ class Config:
             ConfigurationError: If .env file cannot be found or loaded.
         """
         try:
+            if env_path is None and os.environ.get('GOOGLE_MAPS_API_KEY'):
+                # Already configured by the environment; no .env file needed
+                self._config = self._settings_from_env(os.environ)
+                logger.debug("Environment variables read from process environment")
+                return
+
             if env_path is None:
-                # Find the project root directory
-                project_root = Path(__file__).parent.parent
-                env_path = project_root / '.env'
-                env_template_path = project_root / '.env.template'
+                env_path = _DEFAULT_ENV
+                env_template_path = _DEFAULT_ENV_TEMPLATE
+            else:
+                env_template_path = Path(env_path).parent / '.env.template'
+
+            # One stat tells whether the file exists and when it last changed
+            try:
+                env_stat = os.stat(env_path)
+            except FileNotFoundError:
+                env_stat = None
+
+            if env_stat is None:
+                # Only look for the template when the .env file is missing
+                try:
+                    os.stat(env_template_path)
+                    template_exists = True
+                except FileNotFoundError:
+                    template_exists = False
 
-            if not os.path.exists(env_path):
-                if os.path.exists(env_template_path):
+                if template_exists:
                     # If .env doesn't exist but template does, guide the user
                     raise ConfigurationError(
                         "No .env file found! Please:\n"
@@ -64,28 +102,69 @@ class Config:
             # if not os.path.exists(env_path):
             #     raise ConfigurationError(f".env file not found at {env_path}")
 
+            env_path = os.path.abspath(env_path)
+            cache_key = (env_path, env_stat.st_mtime_ns)
+            if cache_key in _ENV_CACHE:
+                self._config = dict(_ENV_CACHE[cache_key])
+                logger.debug("Environment variables reused from cache")
+                return
+
             # Load environment variables from .env file
             load_dotenv(env_path)
             
             # Store configuration values
-            self._config = {
-                'google_maps_api_key': os.getenv('GOOGLE_MAPS_API_KEY'),
-                'log_level': os.getenv('LOG_LEVEL', 'INFO'),
-                'max_retries': int(os.getenv('MAX_RETRIES', '3')),
-                'timeout': int(os.getenv('TIMEOUT', '10')),
-            }
+            self._config = self._settings_from_env(os.environ)
+            _ENV_CACHE[cache_key] = dict(self._config)
             
             logger.debug("Environment variables loaded successfully")
             
+        except ConfigurationError:
+            raise
         except Exception as e:
             raise ConfigurationError(f"Error loading environment variables: {str(e)}")
 
+    @staticmethod
+    def _settings_from_env(env: Mapping[str, str]) -> Dict:
+        """
+        Read the application settings from environment variables.
+        
+        Args:
+            env (Mapping[str, str]): Environment to read, usually os.environ
+            
+        Returns:
+            Dict: Configuration values
+            
+        Raises:
+            ConfigurationError: If MAX_RETRIES or TIMEOUT is not a positive integer
+        """
+        settings = {
+            'google_maps_api_key': env.get('GOOGLE_MAPS_API_KEY'),
+            'log_level': env.get('LOG_LEVEL', 'INFO'),
+        }
+        
+        # Cast and validate numeric values once, as they are read
+        for key, name, default in (
+            ('max_retries', 'MAX_RETRIES', '3'),
+            ('timeout', 'TIMEOUT', '10'),
+        ):
+            try:
+                value = int(env.get(name, default))
+            except ValueError as e:
+                raise ConfigurationError(f"Invalid configuration value: {str(e)}")
+            if value < 1:
+                raise ConfigurationError(f"{name} must be a positive integer")
+            settings[key] = value
+        
+        return settings
+
     def _validate_config(self) -> None:
         """
         Validate required configuration values.
         
+        Numeric values are already validated by _load_env as they are read.
+        
         Raises:
-            ConfigurationError: If any required configuration is missing or invalid.
+            ConfigurationError: If any required configuration is missing.
         """
         # Check for required configurations
         if not self._config.get('google_maps_api_key'):
@@ -94,16 +173,6 @@ class Config:
                 "Please set GOOGLE_MAPS_API_KEY in .env file"
             )
 
-        # Validate numeric values
-        try:
-            if not isinstance(self._config['max_retries'], int) or self._config['max_retries'] < 1:
-                raise ConfigurationError("MAX_RETRIES must be a positive integer")
-            
-            if not isinstance(self._config['timeout'], int) or self._config['timeout'] < 1:
-                raise ConfigurationError("TIMEOUT must be a positive integer")
-        except (ValueError, TypeError) as e:
-            raise ConfigurationError(f"Invalid configuration value: {str(e)}")
-
     def get(self, key: str, default=None) -> any:
         """
         Get configuration value.
@@ -117,17 +186,26 @@ class Config:
         """
         return self._config.get(key, default)
 
-    def get_all(self) -> Dict:
+    def get_all(self) -> Mapping:
         """
         Get all configuration values.
         
+        Returns:
+            Mapping: Read-only view of all configuration values
+        """
+        return self._config_view
+
+    def get_all_copy(self) -> Dict:
+        """
+        Get a modifiable copy of all configuration values.
+        
         Returns:
             Dict: Dictionary containing all configuration values
         """
         return self._config.copy()
 
-# Create a singleton instance
-config = Config()
+# Singleton instance, created on first use by get_config()
+_config_instance: Optional[Config] = None
 
 def get_config() -> Config:
     """
@@ -136,4 +214,7 @@ def get_config() -> Config:
     Returns:
         Config: Singleton configuration instance
     """
-    return config
\ No newline at end of file
+    global _config_instance
+    if _config_instance is None:
+        _config_instance = Config()
+    return _config_instance
\ No newline at end of file
@@ -3,14 +3,115 @@ Google Maps API client module for handling all interactions with Google Maps ser
 """
 
 import googlemaps
+from googlemaps.exceptions import ApiError, HTTPError, Timeout, TransportError
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 import logging
 from .config import get_config
+from .cache import LRUCache, DiskCache
+from pathlib import Path
+import random
+import threading
 import time
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of destinations the Distance Matrix API accepts per request
+MAX_DESTINATIONS_PER_REQUEST = 25
+
+# Origins per request, keeping origins x destinations within the API's limit
+# of 100 elements per request
+MAX_ORIGINS_PER_REQUEST = 100 // MAX_DESTINATIONS_PER_REQUEST
+
+# Maximum number of (origin, destination) driving results kept in memory
+DRIVING_CACHE_SIZE = 4096
+
+# Driving results are cached per departure window of this many seconds, so
+# repeated checks reuse them while traffic estimates still get refreshed
+DEPARTURE_BUCKET_SECONDS = 15 * 60
+
+# Maximum number of geocoding and route results kept in memory
+GEOCODE_CACHE_SIZE = 4096
+ROUTE_CACHE_SIZE = 256
+
+# Geocoding results are also persisted here so they survive restarts, and
+# re-fetched once older than GEOCODE_CACHE_MAX_AGE seconds
+GEOCODE_CACHE_PATH = Path.home() / '.cache' / 'distance_checker' / 'geocode.db'
+GEOCODE_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+# Number of API requests run concurrently by the client's shared worker
+# pool; matches the client's rate limit of 10 queries per second
+API_WORKERS = 10
+
+# Unit conversions applied to API distances (meters) and durations (seconds)
+_M_TO_KM = 1 / 1000.0
+_M_TO_MI = 1 / 1609.344
+_S_TO_MIN = 1 / 60.0
+
+# Retry delays in seconds: exponential from RETRY_BASE_DELAY, capped at
+# RETRY_MAX_DELAY, or RETRY_MAX_DELAY_THROTTLED when the API asked us to slow
+# down, plus up to RETRY_JITTER of random jitter
+RETRY_BASE_DELAY = 0.1
+RETRY_MAX_DELAY = 1.0
+RETRY_MAX_DELAY_THROTTLED = 8.0
+RETRY_JITTER = 0.1
+
+# API statuses worth retrying; any other ApiError (REQUEST_DENIED,
+# INVALID_REQUEST, NOT_FOUND, ...) fails the same way every time
+RETRYABLE_API_STATUSES = frozenset({'OVER_QUERY_LIMIT', 'UNKNOWN_ERROR'})
+
+# Keep-alive connections kept open to the Google Maps API host; above
+# API_WORKERS so the workers plus the GUI's own lookups never wait for one
+HTTP_POOL_SIZE = 20
+
+def chunks(items: List, size: int):
+    """
+    Split a list into consecutive slices.
+    
+    Args:
+        items (List): Items to split
+        size (int): Maximum number of items per slice
+        
+    Yields:
+        List: Slices of at most ``size`` items, in input order
+    """
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+def normalize_address(address: str) -> str:
+    """
+    Normalize an address for use as a cache key.
+    
+    Args:
+        address (str): Address as entered by the user
+        
+    Returns:
+        str: Address in lower case, with runs of whitespace collapsed to a
+            single space and surrounding whitespace removed
+    """
+    return " ".join(address.split()).lower()
+
+# Values of the result fields in an error result, per result shape
+_DRIVING_ERROR_FIELDS = {'duration_minutes': None, 'distance_km': None, 'distance_miles': None}
+_COORDINATES_ERROR_FIELDS = {'lat': 0, 'lng': 0, 'formatted_address': None}
+_ROUTE_ERROR_FIELDS = {'duration_minutes': 0, 'distance_km': 0, 'distance_miles': 0}
+
+def _error_dict(message: str, **fields) -> Dict:
+    """
+    Build an error result.
+    
+    Args:
+        message (str): Error description
+        **fields: Result fields and the values they take on error
+        
+    Returns:
+        Dict: The fields, with status 'ERROR' and the error message
+    """
+    return {**fields, 'status': 'ERROR', 'error_message': message}
+
 class GoogleMapsError(Exception):
     """Custom exception for Google Maps API related errors."""
     pass
@@ -18,6 +119,11 @@ class GoogleMapsError(Exception):
 class GoogleMapsClient:
     """Client for interacting with Google Maps APIs."""
     
+    __slots__ = (
+        'api_key', 'max_retries', 'timeout', 'client', 'session', '_executor',
+        '_pending', '_pending_lock', '_closed', '_driving_cache', '_geocode_cache', '_route_cache', '_geocode_disk_cache'
+    )
+    
     def __init__(self):
         """Initialize Google Maps client with API key from config."""
         config = get_config()
@@ -25,12 +131,61 @@ class GoogleMapsClient:
         self.max_retries = config.get('max_retries', 3)
         self.timeout = config.get('timeout', 10)
         
+        # Successful driving results keyed by normalized (origin, destination)
+        # and departure window
+        self._driving_cache = LRUCache(maxsize=DRIVING_CACHE_SIZE)
+        
+        # Successful geocoding results keyed by normalized address, and
+        # routes keyed by normalized (origin, destination). Routes are not
+        # persisted because their durations depend on current traffic.
+        self._geocode_cache = LRUCache(maxsize=GEOCODE_CACHE_SIZE)
+        self._route_cache = LRUCache(maxsize=ROUTE_CACHE_SIZE)
+        try:
+            self._geocode_disk_cache = DiskCache(
+                GEOCODE_CACHE_PATH, table='geocode', max_age=GEOCODE_CACHE_MAX_AGE
+            )
+        except Exception as e:
+            logger.warning(f"Geocoding disk cache unavailable: {str(e)}")
+            self._geocode_disk_cache = None
+        
+        # Worker threads shared by every concurrent lookup of this client,
+        # instead of a new pool per call
+        self._executor = ThreadPoolExecutor(
+            max_workers=API_WORKERS, thread_name_prefix='maps-api'
+        )
+        
+        # Futures submitted to the pool and not yet finished, so shutdown()
+        # can cancel the queued ones
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+        self._closed = False
+        
+        # Share one pooled HTTPS session across all calls and threads so each
+        # request reuses an open connection instead of a new TCP/TLS handshake.
+        # Transport retries are off: _handle_api_call already retries.
+        self.session = requests.Session()
+        self.session.mount(
+            'https://',
+            HTTPAdapter(
+                pool_connections=HTTP_POOL_SIZE,
+                pool_maxsize=HTTP_POOL_SIZE,
+                max_retries=0
+            )
+        )
+        
+        # The googlemaps SDK is kept rather than calling the web services
+        # directly: it provides the per-second rate limiting, retries on
+        # OVER_QUERY_LIMIT and parameter conversion (e.g. departure_time to
+        # epoch seconds) this client relies on. Its per-call CPU cost is small
+        # next to the network round trip, which batching and caching already
+        # minimise.
         try:
             self.client = googlemaps.Client(
                 key=self.api_key,
                 timeout=self.timeout,
                 retry_over_query_limit=True,
-                queries_per_second=10
+                queries_per_second=10,
+                requests_session=self.session
             )
             logger.debug("Google Maps client initialized successfully")
         except Exception as e:
@@ -51,16 +206,124 @@ class GoogleMapsClient:
         Raises:
             GoogleMapsError: If API call fails after all retries
         """
-        retries = 0
-        while retries < self.max_retries:
+        if self._closed:
+            raise GoogleMapsError("Google Maps client has been shut down")
+        
+        # Almost every call succeeds first time, so keep that path straight
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            error = e
+        
+        attempts = 1
+        while True:
+            if not self._is_retryable(error):
+                raise GoogleMapsError(f"API call failed: {str(error)}")
+            if attempts >= self.max_retries:
+                raise GoogleMapsError(f"API call failed after {attempts} retries: {str(error)}")
+            logger.warning(f"API call failed (attempt {attempts}), retrying...")
+            time.sleep(self._retry_delay(attempts, error))
+            if self._closed:
+                raise GoogleMapsError(f"API call abandoned on shutdown: {str(error)}")
+            
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                retries += 1
-                if retries == self.max_retries:
-                    raise GoogleMapsError(f"API call failed after {retries} retries: {str(e)}")
-                logger.warning(f"API call failed (attempt {retries}), retrying...")
-                time.sleep(1)  # Wait before retry
+                error = e
+                attempts += 1
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """
+        Run a call on the client's shared pool of API_WORKERS threads.
+        
+        Args:
+            func: Function to call
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+            
+        Returns:
+            Future: Future of the call's result
+        """
+        future = self._executor.submit(func, *args, **kwargs)
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._forget_future)
+        return future
+
+    def _forget_future(self, future: Future) -> None:
+        """Stop tracking a finished future."""
+        with self._pending_lock:
+            self._pending.discard(future)
+
+    def _map(self, func: Callable, items: Iterable) -> List:
+        """
+        Apply a function to every item on the worker pool.
+        
+        Args:
+            func: Function to call with each item
+            items (Iterable): Arguments, one per call
+            
+        Returns:
+            List: Results in the order of items
+        """
+        futures = [self.submit(func, item) for item in items]
+        return [future.result() for future in futures]
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker pool without waiting for queued lookups.
+        
+        Calls that have not started are cancelled, and calls in progress
+        give up instead of retrying, so the process can exit promptly.
+        """
+        self._closed = True
+        with self._pending_lock:
+            pending = list(self._pending)
+        # cancel_futures needs Python 3.9, so cancel them one by one
+        for future in pending:
+            future.cancel()
+        self._executor.shutdown(wait=False)
+        logger.debug("Google Maps client shut down")
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """
+        Check whether a failed API call may succeed if retried.
+        
+        Args:
+            error (Exception): Error raised by the call
+            
+        Returns:
+            bool: True for timeouts, connection errors, throttling and server
+                errors; False for errors that would fail again
+        """
+        if isinstance(error, (Timeout, TransportError)):
+            return True
+        if isinstance(error, HTTPError):
+            return error.status_code == 429 or error.status_code >= 500
+        if isinstance(error, ApiError):
+            return error.status in RETRYABLE_API_STATUSES
+        return False
+
+    @staticmethod
+    def _retry_delay(attempt: int, error: Exception) -> float:
+        """
+        Compute how long to wait before retrying a failed API call.
+        
+        Args:
+            attempt (int): Number of the attempt that just failed, from 1
+            error (Exception): Error raised by that attempt
+            
+        Returns:
+            float: Delay in seconds
+        """
+        throttled = (
+            (isinstance(error, HTTPError) and error.status_code == 429)
+            or (isinstance(error, ApiError) and error.status == 'OVER_QUERY_LIMIT')
+        )
+        cap = RETRY_MAX_DELAY_THROTTLED if throttled else RETRY_MAX_DELAY
+        delay = min(cap, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+        return delay + random.uniform(0, RETRY_JITTER)
 
     def get_driving_time(
         self, 
@@ -83,44 +346,207 @@ class GoogleMapsClient:
                 - status: str, 'OK' or 'ERROR'
                 - error_message: str, only present if status is 'ERROR'
         """
+        return self.get_driving_times([origin], [destination], departure_time)[0]
+
+    def get_driving_times_batch(
+        self,
+        origin: str,
+        destinations: List[str],
+        departure_time: Optional[datetime] = None
+    ) -> List[Dict]:
+        """
+        Get driving times and distances from one origin to many destinations.
+        
+        Args:
+            origin (str): Starting address
+            destinations (List[str]): Ending addresses
+            departure_time (datetime, optional): Departure time for the journey
+            
+        Returns:
+            List[Dict]: One result per destination, in input order, with the
+                same keys as get_driving_time()
+        """
+        return self.get_driving_times([origin], destinations, departure_time)
+
+    def get_driving_times(
+        self,
+        origins: List[str],
+        destinations: List[str],
+        departure_time: Optional[datetime] = None
+    ) -> List[Dict]:
+        """
+        Get driving times and distances for every origin/destination pair.
+        
+        Pairs are sent to the Distance Matrix API in blocks of at most
+        MAX_ORIGINS_PER_REQUEST origins by MAX_DESTINATIONS_PER_REQUEST
+        destinations, so many pairs cost a handful of requests instead of
+        one each, and the blocks are requested concurrently. Pairs already
+        answered during this session for the same departure window are
+        served from memory and not requested again.
+        
+        Args:
+            origins (List[str]): Starting addresses
+            destinations (List[str]): Ending addresses
+            departure_time (datetime, optional): Departure time for the journey
+            
+        Returns:
+            List[Dict]: One result per pair with the same keys as
+                get_driving_time(), ordered by origin and then destination,
+                i.e. the result for origins[i] and destinations[j] is at
+                index i * len(destinations) + j
+        """
+        departure_time = departure_time or datetime.now()
+        width = len(destinations)
+        results = [None] * (len(origins) * width)
+        
+        # Serve previously computed pairs from the cache
+        keys = [
+            self._driving_key(origin, destination, departure_time)
+            for origin in origins
+            for destination in destinations
+        ]
+        for index, key in enumerate(keys):
+            results[index] = self._driving_cache.get(key)
+        
+        blocks = []
+        for origin_chunk in chunks(range(len(origins)), MAX_ORIGINS_PER_REQUEST):
+            for destination_chunk in chunks(range(width), MAX_DESTINATIONS_PER_REQUEST):
+                # Only request the rows and columns of this block with misses
+                row_indexes = [
+                    i for i in origin_chunk
+                    if any(results[i * width + j] is None for j in destination_chunk)
+                ]
+                column_indexes = [
+                    j for j in destination_chunk
+                    if any(results[i * width + j] is None for i in row_indexes)
+                ]
+                if row_indexes:
+                    blocks.append((row_indexes, column_indexes))
+        
+        def fetch(block):
+            row_indexes, column_indexes = block
+            return self._fetch_driving_times(
+                [origins[i] for i in row_indexes],
+                [destinations[j] for j in column_indexes],
+                departure_time
+            )
+        
+        # A single block is fetched inline; several share the worker pool
+        if len(blocks) > 1:
+            fetched = self._map(fetch, blocks)
+        else:
+            fetched = map(fetch, blocks)
+        
+        for (row_indexes, column_indexes), rows in zip(blocks, fetched):
+            for i, row in zip(row_indexes, rows):
+                for j, result in zip(column_indexes, row):
+                    index = i * width + j
+                    if results[index] is None:
+                        results[index] = result
+                        if result['status'] == 'OK':
+                            self._driving_cache.set(keys[index], result)
+        
+        return results
+
+    def _fetch_driving_times(
+        self,
+        origins: List[str],
+        destinations: List[str],
+        departure_time: datetime
+    ) -> List[List[Dict]]:
+        """
+        Request driving times for one block of origins and destinations.
+        
+        Args:
+            origins (List[str]): At most MAX_ORIGINS_PER_REQUEST addresses
+            destinations (List[str]): At most MAX_DESTINATIONS_PER_REQUEST addresses
+            departure_time (datetime): Departure time for the journey
+            
+        Returns:
+            List[List[Dict]]: One row per origin, each with one result per
+                destination, in input order
+        """
         try:
             result = self._handle_api_call(
                 self.client.distance_matrix,
-                origins=[origin],
-                destinations=[destination],
+                origins=origins,
+                destinations=destinations,
                 mode="driving",
-                departure_time=departure_time or datetime.now(),
+                departure_time=departure_time,
                 traffic_model="best_guess"
             )
 
             if result['status'] != 'OK':
                 raise GoogleMapsError(f"Distance Matrix API request failed with status: {result['status']}")
 
-            element = result['rows'][0]['elements'][0]
+            rows = result['rows']
             
-            if element['status'] != 'OK':
-                raise GoogleMapsError(f"Route calculation failed with status: {element['status']}")
-            
-            distance_meters = element['distance']['value']
-            distance_km = distance_meters / 1000
-            distance_miles = distance_km * 0.621371  # Convert km to miles
+        except Exception as e:
+            logger.error(f"Error getting driving times: {str(e)}")
+            error = _error_dict(str(e), **_DRIVING_ERROR_FIELDS)
+            return [[error] * len(destinations) for _ in origins]
+        
+        results = []
+        for row in rows:
+            row_results = []
+            for element in row['elements']:
+                if element['status'] == 'OK':
+                    row_results.append(self._parse_element(element))
+                else:
+                    row_results.append(_error_dict(
+                        f"Route calculation failed with status: {element['status']}",
+                        **_DRIVING_ERROR_FIELDS
+                    ))
+            results.append(row_results)
+        return results
+
+    @staticmethod
+    def _driving_key(origin: str, destination: str, departure_time: datetime) -> Tuple:
+        """
+        Build the driving cache key for a pair of addresses.
+        
+        Args:
+            origin (str): Starting address
+            destination (str): Ending address
+            departure_time (datetime): Departure time for the journey
             
-            return {
-                'duration_minutes': element['duration']['value'] / 60,
-                'distance_km': distance_km,
-                'distance_miles': distance_miles,
-                'status': 'OK'
-            }
+        Returns:
+            Tuple: Normalized addresses and departure window
+        """
+        return (
+            normalize_address(origin),
+            normalize_address(destination),
+            int(departure_time.timestamp() // DEPARTURE_BUCKET_SECONDS)
+        )
+
+    def clear_cache(self) -> None:
+        """Discard all cached driving, geocoding and route results."""
+        self._driving_cache.clear()
+        self._geocode_cache.clear()
+        self._route_cache.clear()
+        if self._geocode_disk_cache is not None:
+            self._geocode_disk_cache.clear()
+        logger.info("Google Maps result caches cleared")
+
+    @staticmethod
+    def _parse_element(element: Dict) -> Dict:
+        """
+        Convert a Distance Matrix element into a driving time result.
+        
+        Args:
+            element (Dict): Element with status 'OK' from a Distance Matrix response
             
-        except Exception as e:
-            logger.error(f"Error getting driving time: {str(e)}")
-            return {
-                'duration_minutes': None,
-                'distance_km': None,
-                'distance_miles': None,
-                'status': 'ERROR',
-                'error_message': str(e)
-            }
+        Returns:
+            Dict: Result in the shape returned by get_driving_time()
+        """
+        distance_meters = element['distance']['value']
+        
+        return {
+            'duration_minutes': element['duration']['value'] * _S_TO_MIN,
+            'distance_km': distance_meters * _M_TO_KM,
+            'distance_miles': distance_meters * _M_TO_MI,
+            'status': 'OK'
+        }
 
     def get_coordinates(self, address: str) -> Dict:
         """
@@ -137,24 +563,46 @@ class GoogleMapsClient:
                 - status: str, 'OK' or 'ERROR'
                 - error_message: str, only present if status is 'ERROR'
         """
+        key = normalize_address(address)
+        cached = self._geocode_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        if self._geocode_disk_cache is not None:
+            cached = self._geocode_disk_cache.get(key)
+            if cached is not None:
+                self._geocode_cache.set(key, cached)
+                return cached
+        
+        result = self._fetch_coordinates(address)
+        if result['status'] == 'OK':
+            self._geocode_cache.set(key, result)
+            if self._geocode_disk_cache is not None:
+                self._geocode_disk_cache.set(key, result)
+        return result
+
+    def _fetch_coordinates(self, address: str) -> Dict:
+        """
+        Geocode an address with the Geocoding API, bypassing the caches.
+        
+        Args:
+            address (str): Address to geocode
+            
+        Returns:
+            Dict: Result in the shape returned by get_coordinates()
+        """
         try:
             # Add logging to debug the geocoding process
-            logger.debug(f"Geocoding address: {address}")
+            logger.debug("Geocoding address: %s", address)
             
             result = self._handle_api_call(self.client.geocode, address)
             
             if not result or len(result) == 0:
                 logger.warning(f"No results found for address: {address}")
-                return {
-                    'lat': 0,
-                    'lng': 0,
-                    'formatted_address': None,
-                    'status': 'ERROR',
-                    'error_message': 'No results found'
-                }
+                return _error_dict('No results found', **_COORDINATES_ERROR_FIELDS)
             
             # Log the raw result for debugging
-            logger.debug(f"Geocoding result: {result}")
+            logger.debug("Geocoding result: %s", result)
             
             location = result[0]['geometry']['location']
             formatted_address = result[0]['formatted_address']
@@ -168,30 +616,77 @@ class GoogleMapsClient:
             
         except Exception as e:
             logger.error(f"Error geocoding address '{address}': {str(e)}")
-            return {
-                'lat': 0,
-                'lng': 0,
-                'formatted_address': None,
-                'status': 'ERROR',
-                'error_message': str(e)
-            }
+            return _error_dict(str(e), **_COORDINATES_ERROR_FIELDS)
+
+    def get_coordinates_many(self, addresses: List[str]) -> Dict[str, Dict]:
+        """
+        Geocode several addresses concurrently.
+        
+        Addresses that only differ in case or whitespace are geocoded once,
+        on the client's shared pool of API_WORKERS threads, so the wall time
+        is close to the slowest request rather than the sum of all of them.
+        
+        Args:
+            addresses (List[str]): Addresses to geocode
+            
+        Returns:
+            Dict mapping each address to its get_coordinates() result
+        """
+        keys = [normalize_address(address) for address in addresses]
+        unique = {}
+        for key, address in zip(keys, addresses):
+            unique.setdefault(key, address)
+        
+        results = dict(zip(unique, self._map(self.get_coordinates, unique.values())))
+        return {address: results[key] for key, address in zip(keys, addresses)}
 
-    def get_route(self, origin: str, destination: str) -> Dict:
+    def get_route(self, origin: str, destination: str,
+                  include_points: bool = True) -> Dict:
         """
         Get detailed route information between two addresses.
         
         Args:
             origin (str): Starting address
             destination (str): Ending address
+            include_points (bool): Whether to decode the route's polyline;
+                pass False when only the duration and distance are needed
             
         Returns:
             Dict containing:
-                - points: List of [lat, lng] coordinates for the route
+                - points: List of [lat, lng] coordinates for the route,
+                    empty if include_points is False
                 - duration_minutes: Float, estimated duration
                 - distance_km: Float, total distance
                 - status: str, 'OK' or 'ERROR'
                 - error_message: str, only present if status is 'ERROR'
         """
+        addresses = (normalize_address(origin), normalize_address(destination))
+        
+        # A route with points also answers a request without them
+        cached = self._route_cache.get(addresses + (True,))
+        if cached is None and not include_points:
+            cached = self._route_cache.get(addresses + (False,))
+        if cached is not None:
+            return cached
+        
+        result = self._fetch_route(origin, destination, include_points)
+        if result['status'] == 'OK':
+            self._route_cache.set(addresses + (include_points,), result)
+        return result
+
+    def _fetch_route(self, origin: str, destination: str,
+                     include_points: bool = True) -> Dict:
+        """
+        Get a route from the Directions API, bypassing the cache.
+        
+        Args:
+            origin (str): Starting address
+            destination (str): Ending address
+            include_points (bool): Whether to decode the route's polyline
+            
+        Returns:
+            Dict: Result in the shape returned by get_route()
+        """
         try:
             result = self._handle_api_call(
                 self.client.directions,
@@ -203,52 +698,40 @@ class GoogleMapsClient:
 
             if not result:
                 logger.warning(f"No route found between {origin} and {destination}")
-                return {
-                    'points': [],
-                    'duration_minutes': 0,
-                    'distance_km': 0,
-                    'distance_miles': 0,
-                    'status': 'ERROR',
-                    'error_message': 'No route found'
-                }
+                return _error_dict('No route found', points=[], **_ROUTE_ERROR_FIELDS)
 
             # Extract route points from the polyline
             route = result[0]
             points = []
             
-            try:
-                # Extract encoded polyline from overview_polyline
-                overview_points = route['overview_polyline']['points']
-                decoded_points = googlemaps.convert.decode_polyline(overview_points)
-                # Convert to list of [lat, lng] coordinates
-                points = [[point['lat'], point['lng']] for point in decoded_points]
-            except Exception as e:
-                logger.error(f"Error decoding route polyline: {str(e)}")
-                points = []
-            distance_meters = route['legs'][0]['distance']['value']
-            distance_km = distance_meters / 1000
-            distance_miles = distance_km * 0.621371
+            if include_points:
+                try:
+                    # Imported here so NumPy is only loaded once a route is needed
+                    from .polyline import decode_polyline
+                    
+                    # Extract encoded polyline from overview_polyline and decode
+                    # it to a list of [lat, lng] coordinates
+                    overview_points = route['overview_polyline']['points']
+                    points = decode_polyline(overview_points).tolist()
+                except Exception as e:
+                    logger.error(f"Error decoding route polyline: {str(e)}")
+                    points = []
+            leg = route['legs'][0]
+            distance_meters = leg['distance']['value']
             return {
                 'points': points,
-                'duration_minutes': route['legs'][0]['duration']['value'] / 60,
-                'distance_km': distance_km,
-                'distance_miles': distance_miles,
+                'duration_minutes': leg['duration']['value'] * _S_TO_MIN,
+                'distance_km': distance_meters * _M_TO_KM,
+                'distance_miles': distance_meters * _M_TO_MI,
                 'status': 'OK'
             }
             
         except Exception as e:
             logger.error(f"Error getting route: {str(e)}")
-        return {
-            'points': [],
-            'duration_minutes': 0,
-            'distance_km': 0,
-            'distance_miles': 0,
-            'status': 'ERROR',
-            'error_message': str(e)
-        }
+            return _error_dict(str(e), points=[], **_ROUTE_ERROR_FIELDS)
 
-# Create a singleton instance
-maps_client = GoogleMapsClient()
+# Singleton instance, created on first use by get_maps_client()
+_maps_client: Optional[GoogleMapsClient] = None
 
 def get_maps_client() -> GoogleMapsClient:
     """
@@ -257,4 +740,7 @@ def get_maps_client() -> GoogleMapsClient:
     Returns:
         GoogleMapsClient: Singleton client instance
     """
-    return maps_client
\ No newline at end of file
+    global _maps_client
+    if _maps_client is None:
+        _maps_client = GoogleMapsClient()
+    return _maps_client
\ No newline at end of file
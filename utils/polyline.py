@@ -0,0 +1,163 @@
+"""
+Helpers for preparing route polylines for display.
+"""
+
+import numpy as np
+from typing import List, Sequence
+
+# Simplification tolerance in degrees, roughly 11 meters at the equator
+SIMPLIFY_TOLERANCE = 1e-4
+
+# Encoded polylines store coordinates in units of 1e-5 degrees
+POLYLINE_PRECISION = 1e-5
+
+def decode_polyline(encoded: str) -> np.ndarray:
+    """
+    Decode a Google encoded polyline.
+
+    Equivalent to googlemaps.convert.decode_polyline, but vectorized: the
+    5-bit chunks of every value are combined with NumPy instead of a
+    per-character Python loop.
+
+    Args:
+        encoded (str): Polyline in Google's encoded polyline format
+
+    Returns:
+        np.ndarray: Array of shape (n, 2) of (lat, lng) pairs
+
+    Raises:
+        ValueError: If the string is not a valid encoded polyline
+    """
+    chunks = np.frombuffer(encoded.encode('ascii'), dtype=np.uint8).astype(np.int64) - 63
+    if chunks.size == 0:
+        return np.empty((0, 2), dtype=np.float64)
+    if (chunks < 0).any() or (chunks > 63).any():
+        raise ValueError("Invalid character in encoded polyline")
+
+    # A chunk without the continuation bit (0x20) ends a value
+    ends = np.flatnonzero((chunks & 0x20) == 0)
+    if ends.size == 0 or ends[-1] != chunks.size - 1 or ends.size % 2:
+        raise ValueError("Truncated encoded polyline")
+    starts = np.concatenate(([0], ends[:-1] + 1))
+
+    # Each chunk holds the next 5 bits of its value, least significant first
+    position = np.arange(chunks.size) - np.repeat(starts, ends - starts + 1)
+    values = np.add.reduceat((chunks & 0x1f) << (5 * position), starts)
+
+    # Undo the zigzag sign encoding, then the delta encoding
+    deltas = np.where(values & 1, ~(values >> 1), values >> 1)
+    return np.cumsum(deltas.reshape(-1, 2), axis=0) * POLYLINE_PRECISION
+
+def _to_array(points: Sequence) -> np.ndarray:
+    """
+    Convert (lat, lng) pairs to an array of shape (n, 2).
+
+    Well-formed input is converted in a single call. If that fails, for
+    example because some points are malformed, the points are converted one
+    at a time and the malformed ones are dropped.
+
+    Args:
+        points (Sequence): (lat, lng) pairs
+
+    Returns:
+        np.ndarray: Array of shape (n, 2)
+    """
+    try:
+        arr = np.asarray(points, dtype=np.float64)
+        if arr.ndim == 2 and arr.shape[1] == 2:
+            return arr
+    except (ValueError, TypeError):
+        pass
+
+    pairs = []
+    for point in points:
+        if isinstance(point, (list, tuple)) and len(point) == 2:
+            try:
+                pairs.append((float(point[0]), float(point[1])))
+            except (ValueError, TypeError):
+                continue
+    return np.array(pairs, dtype=np.float64).reshape(-1, 2)
+
+def validate_points(points: Sequence) -> np.ndarray:
+    """
+    Convert route points to an array, dropping any that are not valid.
+
+    A point is valid if both coordinates are finite and within the range
+    of latitudes and longitudes.
+
+    Args:
+        points (Sequence): (lat, lng) pairs
+
+    Returns:
+        np.ndarray: Array of shape (n, 2) containing only valid points
+    """
+    arr = _to_array(points)
+    with np.errstate(invalid='ignore'):
+        mask = (
+            np.isfinite(arr).all(axis=1)
+            & (np.abs(arr[:, 0]) <= 90)
+            & (np.abs(arr[:, 1]) <= 180)
+        )
+    return arr[mask]
+
+def simplify(points: np.ndarray, tolerance: float = SIMPLIFY_TOLERANCE) -> np.ndarray:
+    """
+    Simplify a polyline with the Douglas-Peucker algorithm.
+
+    Points closer than tolerance to the line between the points kept around
+    them are dropped. The first and last points are always kept.
+
+    Args:
+        points (np.ndarray): Array of shape (n, 2)
+        tolerance (float): Maximum distance, in degrees, of a dropped point
+            from the simplified line
+
+    Returns:
+        np.ndarray: Simplified array of shape (m, 2), m <= n
+    """
+    n = len(points)
+    if n < 3:
+        return points
+
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+
+        segment = points[end] - points[start]
+        offsets = points[start + 1:end] - points[start]
+        length = np.hypot(segment[0], segment[1])
+        if length == 0:
+            distances = np.hypot(offsets[:, 0], offsets[:, 1])
+        else:
+            # Perpendicular distance from the chord through start and end
+            distances = np.abs(
+                segment[0] * offsets[:, 1] - segment[1] * offsets[:, 0]
+            ) / length
+
+        index = int(np.argmax(distances))
+        if distances[index] > tolerance:
+            split = start + 1 + index
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+
+    return points[keep]
+
+def prepare_route_points(points: Sequence,
+                         tolerance: float = SIMPLIFY_TOLERANCE) -> List[List[float]]:
+    """
+    Validate and simplify route points for drawing on a map.
+
+    Args:
+        points (Sequence): (lat, lng) pairs from a route
+        tolerance (float): Simplification tolerance in degrees
+
+    Returns:
+        List[List[float]]: Simplified [lat, lng] pairs
+    """
+    return simplify(validate_points(points), tolerance).tolist()
@@ -0,0 +1,23 @@
+"""
+Lightweight records passed between the results table and the map preview.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass(frozen=True)
+class AddressRecord:
+    """
+    A checked address as shown on the map.
+
+    Attributes:
+        address (str): Address as entered by the user
+        drive_time (float, optional): Driving time in minutes
+        distance (float, optional): Driving distance in miles
+    """
+    # Declared by hand since dataclass(slots=True) needs Python 3.10
+    __slots__ = ('address', 'drive_time', 'distance')
+
+    address: str
+    drive_time: Optional[float]
+    distance: Optional[float]